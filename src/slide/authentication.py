@@ -1,12 +1,26 @@
 """Methods that facilitate authentication for the Slide API."""
+from __future__ import annotations
+
 import hashlib
-import os
 import re
-import time
+import secrets
+import warnings
 from dataclasses import dataclass
+from functools import lru_cache
+
+# Matches each `key=value` or `key="value"` pair of a WWW-Authenticate header.
+_HEADER_PARAM_PATTERN = re.compile(
+    r'(?P<key>\w+)\s*=\s*(?:"(?P<quoted>[^"]*)"|(?P<token>[^,\s]+))'
+)
 
+# Named hashlib constructors for the common RFC 7616 algorithm tokens.
+_DIGEST_ALGORITHMS = {
+    "MD5": hashlib.md5,
+    "SHA-256": hashlib.sha256,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DigestAuthenticationHeader:
     """Fields from the Digest authentication header."""
 
@@ -14,24 +28,49 @@ class DigestAuthenticationHeader:
     realm: str
     qop: str
     nc: str  # pylint: disable=invalid-name
-    cnonce_count: int
+    cnonce_count: int | None = None
     algorithm: str = "MD5"
 
+    def __post_init__(self) -> None:
+        if self.cnonce_count is not None:
+            warnings.warn(
+                "cnonce_count is deprecated and ignored.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+
+@lru_cache(maxsize=8)
+def _parse_header_params(header_data: str) -> tuple[str, str, str]:
+    """Extract nonce, realm and qop from a WWW-Authenticate header."""
+    params = {
+        match["key"]: match["quoted"] if match["quoted"] is not None else match["token"]
+        for match in _HEADER_PARAM_PATTERN.finditer(header_data)
+    }
+    return params["nonce"], params["realm"], params["qop"]
+
 
 def parse_response_header(
-    header_data: str, cnonce_count: int
+    header_data: str, cnonce_count: int | None = None
 ) -> DigestAuthenticationHeader:
-    """Parse response header into parameters used when calculating the digest."""
-    nonce = re.findall(r'nonce="(.*?)"', header_data)[0]
-    realm = re.findall(r'realm="(.*?)"', header_data)[0]
-    qop = re.findall(r'qop="(.*?)"', header_data)[0]
+    """
+    Parse response header into parameters used when calculating the digest.
+
+    `cnonce_count` is deprecated and ignored, as the cnonce is random.
+    """
+    if cnonce_count is not None:
+        warnings.warn(
+            "cnonce_count is deprecated and ignored.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    nonce, realm, qop = _parse_header_params(header_data)
 
     return DigestAuthenticationHeader(
         nonce=nonce,
         realm=realm,
         qop=qop,
         nc="00000001",
-        cnonce_count=cnonce_count,
     )
 
 
@@ -41,45 +80,48 @@ def calculate_digest_key(
     uri: str,
     request_type: str,
     digest_info: DigestAuthenticationHeader,
+    hash_1_cache: dict[tuple[str, str, str, str], str] | None = None,
 ) -> str:
-    """Calculate digest key."""
-    # Create a hash object based on the specified algorithm
-    if not hasattr(hashlib, digest_info.algorithm.lower()):
-        raise ValueError(f"Unsupported algorithm: {digest_info.algorithm}")
+    """
+    Calculate digest key.
+
+    The first hash only depends on the credentials, realm and algorithm. When a
+    `hash_1_cache` is provided, it is reused across calls instead of recalculated.
+    """
+    # Find the hash constructor for the specified algorithm
+    hash_object = _DIGEST_ALGORITHMS.get(digest_info.algorithm.upper())
+    if hash_object is None:
+        # Fall back to any algorithm that hashlib provides under its own name.
+        if not hasattr(hashlib, digest_info.algorithm.lower()):
+            raise ValueError(f"Unsupported algorithm: {digest_info.algorithm}")
+        hash_object = getattr(hashlib, digest_info.algorithm.lower())
 
     if digest_info.qop == "auth" or "auth" in digest_info.qop.split(","):
         raise ValueError(f"Invalid digest authentication qop={digest_info.qop} found.")
 
-    hash_object = getattr(hashlib, digest_info.algorithm.lower())
-
-    cnonce = hashlib.sha1(
-        str(digest_info.cnonce_count).encode("utf-8")
-        + digest_info.nonce.encode("utf-8")
-        + time.ctime().encode("utf-8")
-        + os.urandom(8)
-    ).hexdigest()[:8]
+    cnonce = secrets.token_hex(8)
 
     # calculate hash 1
-    hash_1 = hash_object(
-        ":".join(
-            [
-                username,
-                digest_info.realm,
-                password,
-            ]
-        ).encode("utf-8")
-    ).hexdigest()
+    cache_key = (username, digest_info.realm, password, digest_info.algorithm)
+    if hash_1_cache is not None and cache_key in hash_1_cache:
+        hash_1 = hash_1_cache[cache_key]
+    else:
+        hash_1 = hash_object(
+            f"{username}:{digest_info.realm}:{password}".encode("utf-8")
+        ).hexdigest()
+        if hash_1_cache is not None:
+            hash_1_cache[cache_key] = hash_1
 
     # calculate hash 2
-    hash_2 = hash_object(":".join([request_type, uri]).encode("utf-8")).hexdigest()
-
-    # Concatenate the username, password, and realm with a colon separator
-    credentials = ":".join(
-        [hash_1, digest_info.nonce, digest_info.nc, cnonce, digest_info.qop, hash_2]
-    )
+    hash_2 = hash_object(f"{request_type}:{uri}".encode("utf-8")).hexdigest()
 
-    # Convert the concatenated string to bytes and calculate the hash
-    response = hash_object(credentials.encode("utf-8")).hexdigest()
+    # Hash the first hash, nonce, nonce count, cnonce, qop and second hash combined
+    response = hash_object(
+        (
+            f"{hash_1}:{digest_info.nonce}:{digest_info.nc}:"
+            f"{cnonce}:{digest_info.qop}:{hash_2}"
+        ).encode("utf-8")
+    ).hexdigest()
 
     return (
         f'Digest username="{username}", '
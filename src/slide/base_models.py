@@ -1,13 +1,15 @@
 """Module for dealing with the Slide API."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum, auto
+from datetime import datetime, timedelta, timezone
+from enum import Enum
 from typing import Any, AsyncIterator
 
 import aiohttp
@@ -15,23 +17,44 @@ from aiohttp.web import HTTPBadRequest, HTTPForbidden, HTTPUnauthorized
 
 from slide.authentication import calculate_digest_key, parse_response_header
 
+# orjson is used when the optional `orjson` extra is installed.
+try:
+    import orjson
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+else:
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string using orjson."""
+        # Accept non-str dict keys, like the json module does.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _json_loads = orjson.loads
+
 logger = logging.getLogger(__name__)
 
 TIMEOUT = 30
+CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=TIMEOUT)
+# Request a new access token when the current one expires within this margin.
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=30)
 DEFAULT_BASE_URL = "https://api.goslide.io/api"
 
 
-class RequestTypes(Enum):
+class RequestTypes(str, Enum):
     """Possible request types for Slide API."""
 
-    GET = auto()
-    POST = auto()
-    PUT = auto()
-    PATCH = auto()
-    DELETE = auto()
+    GET = "GET"
+    POST = "POST"
+    PUT = "PUT"
+    PATCH = "PATCH"
+    DELETE = "DELETE"
 
+    def __str__(self) -> str:
+        return str.__str__(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SlideURLMapping:
     """Mapping of Slide API endpoints."""
 
@@ -75,7 +98,8 @@ class Slide(ABC):
     _digest: str
     _token_expires: datetime
     _access_token: str
-    _cnoncecount: int
+    _session: aiohttp.ClientSession | None
+    _session_loop: asyncio.AbstractEventLoop | None
     url: SlideURLMapping
 
     def __init__(
@@ -92,10 +116,49 @@ class Slide(ABC):
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
-        self._cnoncecount = 0
         self._access_token = ""
-        self._token_expires = datetime.now()
+        self._token_expires = datetime.now(timezone.utc)
         self._base_url = base_url
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self: Slide) -> Slide:
+        return self
+
+    async def __aexit__(self: Slide, *_: Any) -> None:
+        await self.close()
+
+    async def close(self: Slide) -> None:
+        """Close the HTTP session, if one was opened."""
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                # The session belongs to another (likely closed) event loop.
+                self._session.detach()
+            self._session = None
+            self._session_loop = None
+
+    def _get_session(self: Slide) -> aiohttp.ClientSession:
+        """
+        Return the HTTP session, opening a new one if needed.
+
+        A session is bound to the event loop it was created in, so a new one is
+        opened when the Slide is used from another loop, e.g. by consecutive
+        `asyncio.run` calls.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            # The connections of the stale session can't be closed from this loop.
+            self._session.detach()
+            self._session = None
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=CLIENT_TIMEOUT,
+                json_serialize=_json_dumps,
+            )
+            self._session_loop = loop
+        return self._session
 
     @abstractmethod
     async def login(
@@ -117,18 +180,17 @@ class Slide(ABC):
         """Send a request and yield its raw response."""
         logger.debug(
             "Request: type=%s, url=%s%s, verify_ssl=%s",
-            request_type.name,
+            request_type,
             self._base_url,
             url_suffix,
             verify_ssl,
         )
-        async with aiohttp.request(
-            method=request_type.name,
+        async with self._get_session().request(
+            method=request_type,
             url=self._base_url + url_suffix,
             headers=headers,
             json=data,
-            timeout=aiohttp.ClientTimeout(total=TIMEOUT),
-            connector=None if verify_ssl else aiohttp.TCPConnector(verify_ssl=False),
+            ssl=None if verify_ssl else False,
         ) as response:
             yield response
 
@@ -174,7 +236,7 @@ class Slide(ABC):
         ) as response:
             match response.status:
                 case 200 | 424:
-                    return await response.json()
+                    return await response.json(loads=_json_loads)
                 case 400:
                     raise HTTPBadRequest(
                         headers=self.headers,
@@ -234,6 +296,7 @@ class SlideLocal(Slide):
             position="/rpc/Slide.SetPos",
             calibrate="/rpc/Slide.Calibrate",
         )
+        self._hash_1_cache: dict[tuple[str, str, str, str], str] = {}
 
         super().__init__(
             base_url=base_url,
@@ -266,16 +329,13 @@ class SlideLocal(Slide):
     ) -> str:
         """Create an access token using Digest authentication."""
         if "WWW-Authenticate" in headers:
-            self._cnoncecount += 1
             return calculate_digest_key(
                 username=str(self.username),
                 password=str(self.device_code),
                 uri=self._base_url + url_suffix,
-                request_type=request_type.name,
-                digest_info=parse_response_header(
-                    headers["WWW-Authenticate"],
-                    cnonce_count=self._cnoncecount,
-                ),
+                request_type=request_type,
+                digest_info=parse_response_header(headers["WWW-Authenticate"]),
+                hash_1_cache=self._hash_1_cache,
             )
         raise HTTPUnauthorized(headers=headers, reason="Authentication failed.")
 
@@ -310,9 +370,9 @@ class SlideCloud(Slide):
         if (
             self._access_token
             and self._token_expires
-            and self._token_expires < datetime.now()
+            and self._token_expires > datetime.now(timezone.utc) + TOKEN_EXPIRY_MARGIN
         ):
-            # If an access token is already provided, don't request a new one.
+            # If a valid access token is already provided, don't request a new one.
             logger.debug("No new access token will be requested.")
         else:
             logger.debug("Requesting access token using username/password.")
@@ -322,9 +382,11 @@ class SlideCloud(Slide):
                 data={"email": self.username, "password": self.password},
                 skip_login=True,
             )
-            self._token_expires = datetime.strptime(
-                token_data["expires_at"] + " +0000", "%Y-%m-%d %H:%M:%S %z"
-            )
+            token_expires = datetime.fromisoformat(token_data["expires_at"])
+            if token_expires.tzinfo is None:
+                # Timestamps without an offset are in UTC.
+                token_expires = token_expires.replace(tzinfo=timezone.utc)
+            self._token_expires = token_expires.astimezone(timezone.utc)
             self._access_token = token_data["access_token"]
         self.headers["Authorization"] = f"Bearer {self._access_token}"
         return self._access_token
@@ -2,6 +2,8 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+from typing import Any
 
 from slide.base_models import RequestTypes, Routine, SlideCloud
 
@@ -24,18 +26,24 @@ class Household:
     created_at: str | None
     updated_at: str | None
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("created_at", "updated_at"):
+            # Drop the timestamp that was parsed from the previous value.
+            self.__dict__.pop(f"{name}_datetime", None)
+
+    @cached_property
     def created_at_datetime(self) -> datetime | None:
         """Parsed created_at property."""
         if self.created_at:
-            return datetime.strptime(self.created_at, "%Y-%m-%d %H:%M:%S")
+            return datetime.fromisoformat(self.created_at)
         return None
 
-    @property
+    @cached_property
     def updated_at_datetime(self) -> datetime | None:
         """Parsed created_at property."""
         if self.updated_at:
-            return datetime.strptime(self.updated_at, "%Y-%m-%d %H:%M:%S")
+            return datetime.fromisoformat(self.updated_at)
         return None
 
 
@@ -0,0 +1,38 @@
+"""Fixtures shared by the Slide tests."""
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from slide.base_models import SlideCloud, SlideLocal
+
+
+@pytest.fixture(scope="session")
+def slide_cloud() -> SlideCloud:
+    """SlideCloud instance shared by all tests."""
+    return SlideCloud(username="user", password="password")
+
+
+@pytest.fixture(scope="session")
+def slide_local() -> SlideLocal:
+    """SlideLocal instance shared by all tests."""
+    return SlideLocal(device_code="asdf", base_url="http://localhost")
+
+
+class _FastAsyncMock(MagicMock):
+    """MagicMock whose calls are awaitable and resolve to its return value."""
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return super().__call__(*args, **kwargs)
+
+    def _get_child_mock(self, **kwargs: Any) -> MagicMock:
+        # Attributes and return values are regular, synchronous mocks.
+        return MagicMock(**kwargs)
+
+
+@pytest.fixture
+def mock_request() -> Iterator[_FastAsyncMock]:
+    """Patch Slide.request for the duration of a test."""
+    with patch(
+        "slide.base_models.Slide.request", new_callable=_FastAsyncMock
+    ) as mock:
+        yield mock
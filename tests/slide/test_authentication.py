@@ -1,7 +1,8 @@
 """Unittests for authentication methods."""
 from __future__ import annotations
 
-import os
+import hashlib
+from typing import Any, Callable
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,90 +14,121 @@ from slide import (
 )
 
 
-@pytest.mark.parametrize(
-    "header_data, cnonce_count, expected_result",
-    [
-        (
-            'nonce="1234567890", realm="example.com", qop="auth"',
-            5,
-            DigestAuthenticationHeader(
-                nonce="1234567890",
-                realm="example.com",
-                qop="auth",
-                nc="00000001",
-                cnonce_count=5,
-            ),
+class _HashStub:
+    """Minimal stand-in for a hashlib hash object."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def hexdigest(self) -> str:
+        return self.value
+
+
+_PARSE_RESPONSE_HEADER_PARAMS = (
+    (
+        'nonce="1234567890", realm="example.com", qop="auth"',
+        DigestAuthenticationHeader(
+            nonce="1234567890",
+            realm="example.com",
+            qop="auth",
+            nc="00000001",
         ),
-        (
-            'nonce="abcdefg", realm="test", qop="auth"',
-            2,
-            DigestAuthenticationHeader(
-                nonce="abcdefg",
-                realm="test",
-                qop="auth",
-                nc="00000001",
-                cnonce_count=2,
-            ),
+    ),
+    (
+        'nonce="abcdefg", realm="test", qop="auth"',
+        DigestAuthenticationHeader(
+            nonce="abcdefg",
+            realm="test",
+            qop="auth",
+            nc="00000001",
         ),
-    ],
+    ),
+    (
+        'Digest realm="test", nonce="abcdefg", qop=auth',
+        DigestAuthenticationHeader(
+            nonce="abcdefg",
+            realm="test",
+            qop="auth",
+            nc="00000001",
+        ),
+    ),
 )
+
+
+@pytest.mark.parametrize("header_data, expected_result", _PARSE_RESPONSE_HEADER_PARAMS)
 def test_parse_response_header(
-    header_data: str, cnonce_count: int, expected_result: DigestAuthenticationHeader
+    header_data: str, expected_result: DigestAuthenticationHeader
 ):
     """Test parsing of response header."""
-    result = parse_response_header(header_data, cnonce_count)
+    result = parse_response_header(header_data)
     assert result == expected_result
 
 
-# pylint: disable=too-many-arguments,line-too-long
-@patch("slide.authentication.hashlib")
-@patch("slide.authentication.time")
-@pytest.mark.parametrize(
-    "username, password, uri, request_type, digest_info, expected_result",
-    [
+def test_cnonce_count_deprecated():
+    """Test that passing the ignored cnonce_count warns."""
+    header_data = 'nonce="abcdefg", realm="test", qop="auth"'
+
+    with pytest.deprecated_call():
+        result = parse_response_header(header_data, cnonce_count=2)
+    with pytest.deprecated_call():
+        header = DigestAuthenticationHeader(
+            nonce="abcdefg", realm="test", qop="auth", nc="00000001", cnonce_count=2
+        )
+
+    assert result == parse_response_header(header_data)
+    assert header.cnonce_count == 2
+
+
+_CALCULATE_DIGEST_KEY_PARAMS = (
+    (
+        "john",
+        "password123",
+        "/api/resource",
+        RequestTypes.GET,
+        DigestAuthenticationHeader(
+            nonce="1234567890",
+            realm="example.com",
+            qop="anything",
+            nc="00000001",
+            algorithm="MD5",
+        ),
         (
-            "john",
-            "password123",
-            "/api/resource",
-            RequestTypes.GET,
-            DigestAuthenticationHeader(
-                nonce="1234567890",
-                realm="example.com",
-                qop="anything",
-                nc="00000001",
-                cnonce_count=5,
-                algorithm="MD5",
-            ),
-            (
-                'Digest username="john", realm="example.com", nonce="1234567890", '
-                'uri="/api/resource", algorithm="MD5", qop=anything, nc=00000001, '
-                'cnonce="cnonce12", response="hash123"'
-            ),
+            'Digest username="john", realm="example.com", nonce="1234567890", '
+            'uri="/api/resource", algorithm="MD5", qop=anything, nc=00000001, '
+            'cnonce="cnonce12", response="hash123"'
+        ),
+    ),
+    (
+        "jane",
+        "password456",
+        "/api/endpoint",
+        RequestTypes.GET,
+        DigestAuthenticationHeader(
+            nonce="abcdefg",
+            realm="test",
+            qop="anything",
+            nc="00000002",
+            algorithm="MD5",
         ),
         (
-            "jane",
-            "password456",
-            "/api/endpoint",
-            RequestTypes.GET,
-            DigestAuthenticationHeader(
-                nonce="abcdefg",
-                realm="test",
-                qop="anything",
-                nc="00000002",
-                cnonce_count=2,
-                algorithm="MD5",
-            ),
-            (
-                'Digest username="jane", realm="test", nonce="abcdefg", '
-                'uri="/api/endpoint", algorithm="MD5", qop=anything, '
-                'nc=00000002, cnonce="cnonce12", response="hash123"'
-            ),
+            'Digest username="jane", realm="test", nonce="abcdefg", '
+            'uri="/api/endpoint", algorithm="MD5", qop=anything, '
+            'nc=00000002, cnonce="cnonce12", response="hash123"'
         ),
-    ],
+    ),
+)
+
+
+# pylint: disable=too-many-arguments,line-too-long
+@patch("slide.authentication.secrets")
+@pytest.mark.parametrize(
+    "username, password, uri, request_type, digest_info, expected_result",
+    _CALCULATE_DIGEST_KEY_PARAMS,
 )
 def test_calculate_digest_key(
-    mock_time: Mock,
-    mock_hashlib: Mock,
+    mock_secrets: Mock,
     username: str,
     password: str,
     uri: str,
@@ -105,55 +137,89 @@ def test_calculate_digest_key(
     expected_result: str,
 ):
     """Test calculation of digest key."""
-    # Mock the necessary functions and methods for hashlib and os
-    mock_hashlib.sha1 = Mock(
-        return_value=Mock(hexdigest=Mock(return_value="cnonce123"))
-    )
-    mock_hashlib.md5.return_value = Mock(hexdigest=Mock(return_value="hash123"))
+    # Mock the cnonce and hash calculations
+    mock_secrets.token_hex.return_value = "cnonce12"
+    mock_md5 = Mock(return_value=_HashStub("hash123"))
 
-    os.urandom = Mock(return_value=b"cnonce123")
+    with patch.dict("slide.authentication._DIGEST_ALGORITHMS", {"MD5": mock_md5}):
+        result = calculate_digest_key(
+            username, password, uri, request_type.name, digest_info
+        )
+    assert result == expected_result
 
-    # Mock the time.ctime() function
-    mock_time.ctime.return_value = "Mon Jan 01 00:00:00 2023"
+
+@patch("slide.authentication.secrets")
+@pytest.mark.parametrize(
+    "algorithm, hash_object",
+    [
+        ("SHA-256", hashlib.sha256),
+        ("sha256", hashlib.sha256),
+        ("SHA256", hashlib.sha256),
+        ("sha1", hashlib.sha1),
+    ],
+)
+def test_calculate_digest_key_algorithms(
+    mock_secrets: Mock, algorithm: str, hash_object: Callable[..., Any]
+):
+    """Test calculation of digest key with algorithms other than MD5."""
+    mock_secrets.token_hex.return_value = "cnonce12"
+    digest_info = DigestAuthenticationHeader(
+        nonce="abcdefg",
+        realm="test",
+        qop="anything",
+        nc="00000001",
+        algorithm=algorithm,
+    )
+    hash_1 = hash_object(b"jane:test:password456").hexdigest()
+    hash_2 = hash_object(b"GET:/api/endpoint").hexdigest()
+    response = hash_object(
+        f"{hash_1}:abcdefg:00000001:cnonce12:anything:{hash_2}".encode("utf-8")
+    ).hexdigest()
 
     result = calculate_digest_key(
-        username, password, uri, request_type.name, digest_info
+        "jane", "password456", "/api/endpoint", "GET", digest_info
     )
-    assert result == expected_result
 
+    assert result == (
+        'Digest username="jane", realm="test", nonce="abcdefg", '
+        f'uri="/api/endpoint", algorithm="{algorithm}", qop=anything, '
+        f'nc=00000001, cnonce="cnonce12", response="{response}"'
+    )
 
-@pytest.mark.parametrize(
-    "username, password, uri, request_type, digest_info",
-    [
-        (
-            "john",
-            "password123",
-            "/api/resource",
-            RequestTypes.GET,
-            DigestAuthenticationHeader(
-                nonce="1234567890",
-                realm="example.com",
-                qop="anything",
-                nc="00000001",
-                cnonce_count=5,
-                algorithm="FAKEALGO",
-            ),
+
+_CALCULATE_DIGEST_KEY_VALUE_ERROR_PARAMS = (
+    (
+        "john",
+        "password123",
+        "/api/resource",
+        RequestTypes.GET,
+        DigestAuthenticationHeader(
+            nonce="1234567890",
+            realm="example.com",
+            qop="anything",
+            nc="00000001",
+            algorithm="FAKEALGO",
         ),
-        (
-            "john",
-            "password123",
-            "/api/resource",
-            RequestTypes.GET,
-            DigestAuthenticationHeader(
-                nonce="1234567890",
-                realm="example.com",
-                qop="auth",
-                nc="00000001",
-                cnonce_count=5,
-                algorithm="MD5",
-            ),
+    ),
+    (
+        "john",
+        "password123",
+        "/api/resource",
+        RequestTypes.GET,
+        DigestAuthenticationHeader(
+            nonce="1234567890",
+            realm="example.com",
+            qop="auth",
+            nc="00000001",
+            algorithm="MD5",
         ),
-    ],
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "username, password, uri, request_type, digest_info",
+    _CALCULATE_DIGEST_KEY_VALUE_ERROR_PARAMS,
 )
 def test_calculate_digest_key_value_errors(
     username: str,
@@ -167,3 +233,33 @@ def test_calculate_digest_key_value_errors(
         _ = calculate_digest_key(
             username, password, uri, request_type.name, digest_info
         )
+
+
+def test_calculate_digest_key_hash_1_cache():
+    """Test that the first hash is stored in and reused from the cache."""
+    digest_info = DigestAuthenticationHeader(
+        nonce="1234567890",
+        realm="example.com",
+        qop="anything",
+        nc="00000001",
+    )
+    hash_1_cache: dict[tuple[str, str, str, str], str] = {}
+
+    calculate_digest_key(
+        "john", "password123", "/api/resource", "GET", digest_info, hash_1_cache
+    )
+
+    assert hash_1_cache == {
+        ("john", "example.com", "password123", "MD5"): hashlib.md5(
+            b"john:example.com:password123"
+        ).hexdigest()
+    }
+
+    mock_md5 = Mock(return_value=_HashStub("hash123"))
+    with patch.dict("slide.authentication._DIGEST_ALGORITHMS", {"MD5": mock_md5}):
+        calculate_digest_key(
+            "john", "password123", "/api/resource", "GET", digest_info, hash_1_cache
+        )
+
+    # Only the second hash and the response are calculated.
+    assert mock_md5.call_count == 2
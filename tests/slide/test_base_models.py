@@ -1,15 +1,27 @@
 """Test base models."""
+import asyncio
+import importlib.util
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Any, Type
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Type
 from unittest.mock import AsyncMock, Mock, patch
 
-import aiohttp
 import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
 from aiohttp.web import HTTPBadRequest, HTTPClientError, HTTPForbidden, HTTPUnauthorized
 from slide.authentication import calculate_digest_key, parse_response_header
-from slide.base_models import TIMEOUT, RequestTypes, SlideCloud, SlideLocal
+from slide.base_models import (
+    CLIENT_TIMEOUT,
+    RequestTypes,
+    SlideCloud,
+    SlideLocal,
+    _json_dumps,
+    _json_loads,
+)
 
 
 @pytest.mark.parametrize(
@@ -50,7 +62,6 @@ def test_slide_cloud_initialization(
     }
 
     # pylint: disable=protected-access
-    assert slide._cnoncecount == 0  # type: ignore
     assert slide._access_token == ""  # type: ignore
 
     del os.environ["SLIDE_API_USERNAME"]
@@ -59,8 +70,7 @@ def test_slide_cloud_initialization(
 
 # pylint: disable=too-many-arguments
 @pytest.mark.asyncio
-@patch("slide.base_models.aiohttp.request")
-@patch("slide.base_models.aiohttp.TCPConnector")
+@patch("slide.base_models.aiohttp.ClientSession")
 @pytest.mark.parametrize(
     "request_type, url_suffix, data, headers, verify_ssl",
     [
@@ -82,8 +92,7 @@ def test_slide_cloud_initialization(
     ],
 )
 async def test_raw_request(
-    mock_tcp_connector: Mock,
-    mock_request: Mock,
+    mock_client_session: Mock,
     request_type: RequestTypes,
     url_suffix: str,
     data: dict[str, Any] | None,
@@ -94,7 +103,6 @@ async def test_raw_request(
     slide = SlideCloud()
     # pylint: disable=protected-access
     expected_url = slide._base_url + url_suffix
-    mock_tcp_connector.return_value = "test"
 
     async with slide._raw_request(
         request_type=request_type,
@@ -103,20 +111,120 @@ async def test_raw_request(
         headers=headers,
         verify_ssl=verify_ssl,
     ) as _:
-        # Assert that aiohttp.request was called with the correct arguments
-        mock_request.assert_called_once_with(
-            method=request_type.name,
+        # Assert that the session was created and used with the correct arguments
+        mock_client_session.assert_called_once_with(
+            timeout=CLIENT_TIMEOUT,
+            json_serialize=_json_dumps,
+        )
+        mock_client_session.return_value.request.assert_called_once_with(
+            method=request_type,
             url=expected_url,
             headers=headers,
             json=data,
-            timeout=aiohttp.ClientTimeout(total=TIMEOUT),
-            connector=None if verify_ssl else mock_tcp_connector.return_value,
+            ssl=None if verify_ssl else False,
         )
 
 
+@pytest.mark.asyncio
+async def test_session_reuse_and_close():
+    """Test that the session is reused between requests and closed on exit."""
+    async with SlideCloud() as slide:
+        # pylint: disable=protected-access
+        session = slide._get_session()
+
+        assert slide._get_session() is session
+
+    assert session.closed
+    assert slide._session is None
+
+
+def test_session_per_event_loop():
+    """Test that a new session is opened when the Slide is used from another loop."""
+    slide = SlideCloud()
+
+    async def get_session() -> ClientSession:
+        # pylint: disable=protected-access
+        return slide._get_session()
+
+    # Run the loops explicitly, leaving the loop of the event loop policy untouched.
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    stale_connectors = []
+    try:
+        first_session = first_loop.run_until_complete(get_session())
+        stale_connectors.append(first_session.connector)
+        second_session = second_loop.run_until_complete(get_session())
+        second_connector = second_session.connector
+
+        # The stale session is detached, leaving its connector to its own loop.
+        assert second_session is not first_session
+        assert first_session.connector is None
+        assert not stale_connectors[0].closed
+
+        # Closing from the loop of the session closes its connector.
+        second_loop.run_until_complete(slide.close())
+        assert second_connector.closed
+
+        # Closing from another loop only detaches the session.
+        third_session = first_loop.run_until_complete(get_session())
+        stale_connectors.append(third_session.connector)
+        second_loop.run_until_complete(slide.close())
+        assert third_session.connector is None
+        assert not stale_connectors[1].closed
+        # pylint: disable=protected-access
+        assert slide._session is None
+    finally:
+        for connector in stale_connectors:
+            first_loop.run_until_complete(connector.close())
+        first_loop.close()
+        second_loop.close()
+
+
+def test_json_without_orjson():
+    """Test that the json module is used when orjson isn't installed."""
+    spec = importlib.util.find_spec("slide.base_models")
+    assert spec and spec.loader
+    # Execute a fresh copy of the module, leaving the imported one untouched.
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+
+    # pylint: disable=protected-access
+    assert module._json_dumps is json.dumps
+    assert module._json_loads is json.loads
+
+
+def test_json_with_orjson():
+    """Test that orjson encodes and decodes JSON when it's installed."""
+    orjson = pytest.importorskip("orjson")
+
+    assert _json_loads is orjson.loads
+    assert _json_dumps({1: "a", "b": [1.5, None]}) == '{"1":"a","b":[1.5,null]}'
+
+
+@pytest_asyncio.fixture
+async def served_slide_cloud() -> AsyncIterator[tuple[SlideCloud, list[web.Response]]]:
+    """
+    Yield a SlideCloud connected to a local test server, along with the queue of
+    responses that the server returns in order.
+    """
+    responses: list[web.Response] = []
+
+    async def handler(_: web.Request) -> web.Response:
+        return responses.pop(0)
+
+    app = web.Application()
+    app.router.add_route("*", "/api/v1/some-endpoint", handler)
+
+    async with TestServer(app) as server:
+        async with SlideCloud("username", "password") as slide:
+            # pylint: disable=protected-access
+            slide._base_url = str(server.make_url(""))
+            yield slide, responses
+
+
 @pytest.mark.asyncio
 @patch("slide.base_models.SlideCloud.login")
-@patch("slide.base_models.Slide._raw_request")
 @pytest.mark.parametrize(
     "data, verify_ssl, expected_json",
     [
@@ -138,19 +246,15 @@ async def test_raw_request(
     ],
 )
 async def test_request_200(
-    mock_raw_request: Mock,
     mock_login: Mock,
+    served_slide_cloud: tuple[SlideCloud, list[web.Response]],
     data: dict[str, Any] | list[str] | None,
     verify_ssl: bool,
     expected_json: dict[str, Any],
 ):
-    slide = SlideCloud("username", "password")
+    slide, responses = served_slide_cloud
 
-    mock_raw_request.return_value.__aenter__.return_value = Mock(
-        status=200,
-        json=AsyncMock(return_value=expected_json),
-        text=AsyncMock(return_value=json.dumps(expected_json)),
-    )
+    responses.append(web.json_response(expected_json))
 
     response = await slide.request(
         request_type=RequestTypes.POST,
@@ -166,7 +270,6 @@ async def test_request_200(
 
 @pytest.mark.asyncio
 @patch("slide.base_models.SlideCloud.login")
-@patch("slide.base_models.Slide._raw_request")
 @pytest.mark.parametrize(
     "data, verify_ssl, expected_json",
     [
@@ -188,26 +291,20 @@ async def test_request_200(
     ],
 )
 async def test_request_401(
-    mock_raw_request: Mock,
     mock_login: Mock,
+    served_slide_cloud: tuple[SlideCloud, list[web.Response]],
     data: dict[str, Any] | list[str] | None,
     verify_ssl: bool,
     expected_json: dict[str, Any],
 ):
-    slide = SlideCloud("username", "password")
+    slide, responses = served_slide_cloud
 
-    mock_raw_request.return_value.__aenter__.side_effect = [
-        Mock(
-            status=401,
-            json=AsyncMock(return_value=expected_json),
-            text=AsyncMock(return_value=json.dumps(expected_json)),
-        ),
-        Mock(
-            status=200,
-            json=AsyncMock(return_value=expected_json),
-            text=AsyncMock(return_value=json.dumps(expected_json)),
-        ),
-    ]
+    responses.extend(
+        [
+            web.json_response(expected_json, status=401),
+            web.json_response(expected_json),
+        ]
+    )
 
     response = await slide.request(
         request_type=RequestTypes.POST,
@@ -222,7 +319,6 @@ async def test_request_401(
 
 @pytest.mark.asyncio
 @patch("slide.base_models.SlideCloud.login")
-@patch("slide.base_models.Slide._raw_request")
 @pytest.mark.parametrize(
     "status_code, raised_exception",
     [
@@ -231,18 +327,14 @@ async def test_request_401(
     ],
 )
 async def test_request_400_403(
-    mock_raw_request: Mock,
     mock_login: Mock,
+    served_slide_cloud: tuple[SlideCloud, list[web.Response]],
     status_code: int,
     raised_exception: Type[HTTPClientError],
 ):
-    slide = SlideCloud("username", "password")
+    slide, responses = served_slide_cloud
 
-    mock_raw_request.return_value.__aenter__.return_value = Mock(
-        status=status_code,
-        json=AsyncMock(return_value={"error": "message"}),
-        text=AsyncMock(return_value="Error message"),
-    )
+    responses.append(web.Response(status=status_code, text="Error message"))
 
     with pytest.raises(raised_exception):
         await slide.request(
@@ -258,7 +350,6 @@ async def test_request_400_403(
 
 @pytest.mark.asyncio
 @patch("slide.base_models.SlideCloud.login")
-@patch("slide.base_models.Slide._raw_request")
 @pytest.mark.parametrize(
     "data, verify_ssl, expected_json",
     [
@@ -280,19 +371,15 @@ async def test_request_400_403(
     ],
 )
 async def test_request_401_failed_login(
-    mock_raw_request: Mock,
     mock_login: Mock,
+    served_slide_cloud: tuple[SlideCloud, list[web.Response]],
     data: dict[str, Any] | list[str] | None,
     verify_ssl: bool,
     expected_json: dict[str, Any],
 ):
-    slide = SlideCloud("username", "password")
+    slide, responses = served_slide_cloud
 
-    mock_raw_request.return_value.__aenter__.return_value = Mock(
-        status=401,
-        json=AsyncMock(return_value=expected_json),
-        text=AsyncMock(return_value=json.dumps(expected_json)),
-    )
+    responses.append(web.json_response(expected_json, status=401))
 
     with pytest.raises(HTTPUnauthorized) as _:
         await slide.request(
@@ -308,7 +395,6 @@ async def test_request_401_failed_login(
 
 @pytest.mark.asyncio
 @patch("slide.base_models.SlideCloud.login")
-@patch("slide.base_models.Slide._raw_request")
 @pytest.mark.parametrize(
     "data, verify_ssl, expected_json",
     [
@@ -330,19 +416,15 @@ async def test_request_401_failed_login(
     ],
 )
 async def test_request_unknown_status(
-    mock_raw_request: Mock,
     mock_login: Mock,
+    served_slide_cloud: tuple[SlideCloud, list[web.Response]],
     data: dict[str, Any] | list[str] | None,
     verify_ssl: bool,
     expected_json: dict[str, Any],
 ):
-    slide = SlideCloud("username", "password")
+    slide, responses = served_slide_cloud
 
-    mock_raw_request.return_value.__aenter__.return_value = Mock(
-        status=333,
-        json=AsyncMock(return_value=expected_json),
-        text=AsyncMock(return_value=json.dumps(expected_json)),
-    )
+    responses.append(web.json_response(expected_json, status=333))
 
     with pytest.raises(NotImplementedError) as _:
         await slide.request(
@@ -363,9 +445,21 @@ async def test_request_unknown_status(
     [
         (
             "token1",
-            datetime.now() - timedelta(hours=1),
+            datetime.now(timezone.utc) + timedelta(hours=1),
+            {"access_token": "another-token", "expires_at": "2022-01-01 00:00:00"},
+            "token1",
+        ),
+        (
+            "token1",
+            datetime.now(timezone.utc) - timedelta(hours=1),
             {"access_token": "another-token", "expires_at": "2022-01-01 00:00:00"},
+            "another-token",
+        ),
+        (
             "token1",
+            datetime.now(timezone.utc) + timedelta(seconds=10),
+            {"access_token": "another-token", "expires_at": "2022-01-01 00:00:00"},
+            "another-token",
         ),
         (
             None,
@@ -394,10 +488,42 @@ async def test_slide_cloud_login(
     if not response:
         mock_request.assert_not_called()
 
+    # A new token is only requested when the current one is missing or expiring.
+    assert mock_request.called == (expected_token != access_token)
+    if mock_request.called:
+        assert slide._token_expires == datetime(2022, 1, 1, tzinfo=timezone.utc)
     assert token == expected_token
     assert slide.headers["Authorization"] == f"Bearer {expected_token}"
 
 
+@pytest.mark.asyncio
+@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
+@pytest.mark.parametrize(
+    "expires_at, expected_token_expires",
+    [
+        ("2022-01-01 00:00:00", datetime(2022, 1, 1, tzinfo=timezone.utc)),
+        ("2022-01-01 00:00:00+00:00", datetime(2022, 1, 1, tzinfo=timezone.utc)),
+        (
+            "2022-01-01 00:00:00+02:00",
+            datetime(2021, 12, 31, 22, tzinfo=timezone.utc),
+        ),
+    ],
+)
+async def test_slide_cloud_login_token_expires(
+    mock_request: AsyncMock,
+    expires_at: str,
+    expected_token_expires: datetime,
+):
+    """Test that the token expiry is stored in UTC, respecting a given offset."""
+    mock_request.return_value = {"access_token": "token", "expires_at": expires_at}
+
+    slide = SlideCloud(username="user", password="password")
+    await slide.login()
+
+    assert slide._token_expires == expected_token_expires
+    assert slide._token_expires.tzinfo is timezone.utc
+
+
 @pytest.mark.parametrize(
     # pylint: disable=line-too-long
     (
@@ -484,8 +610,7 @@ async def test_slide_local_login(
 
 @pytest.mark.asyncio
 @patch("slide.base_models.Slide._raw_request")
-@patch("slide.authentication.os")
-@patch("slide.authentication.time")
+@patch("slide.authentication.secrets")
 @pytest.mark.parametrize(
     "response_headers",
     [
@@ -501,13 +626,11 @@ async def test_slide_local_login(
     ],
 )
 async def test_request_digest_access_token(
-    mock_time: Mock,
-    mock_os: Mock,
+    mock_secrets: Mock,
     mock_raw_request: Mock,
     response_headers: dict[str, Any],
 ):
-    mock_time.ctime.return_value = "Fri Jun  2 23:53:00 2023"
-    mock_os.urandom.return_value = b"testvalue"
+    mock_secrets.token_hex.return_value = "testvalue"
     mock_raw_request.return_value.__aenter__.return_value = Mock(
         headers=response_headers,
     )
@@ -533,9 +656,7 @@ async def test_request_digest_access_token(
             password=str(slide_local.device_code),
             uri=slide_local._base_url + "/some-url",
             request_type=RequestTypes.POST.name,
-            digest_info=parse_response_header(
-                response_headers["WWW-Authenticate"], cnonce_count=1
-            ),
+            digest_info=parse_response_header(response_headers["WWW-Authenticate"]),
         )
 
 
@@ -44,6 +44,30 @@ def test_created_at_datetime(
     assert household.updated_at_datetime == expected_updated_at
 
 
+def test_datetime_after_update():
+    """Test that the parsed timestamps follow updates of the raw values."""
+    household = Household(
+        id="123",
+        name="Test Household",
+        address="123 Main St",
+        lat=37.7749,
+        lon=-122.4194,
+        xs_code="ABC123",
+        holiday_mode=True,
+        holiday_routines=[],
+        created_at="2022-01-01 00:00:00",
+        updated_at=None,
+    )
+    assert household.created_at_datetime == datetime(2022, 1, 1, 0, 0, 0)
+    assert household.updated_at_datetime is None
+
+    household.created_at = "2023-01-01 00:00:00"
+    household.updated_at = "2023-01-02 00:00:00"
+
+    assert household.created_at_datetime == datetime(2023, 1, 1, 0, 0, 0)
+    assert household.updated_at_datetime == datetime(2023, 1, 2, 0, 0, 0)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "mock_response, expected_household",
@@ -1,5 +1,5 @@
-from typing import Any
-from unittest.mock import AsyncMock, patch
+from typing import Any, Awaitable, Callable
+from unittest.mock import MagicMock, call
 
 import pytest
 from slide.base_models import (
@@ -26,11 +26,13 @@ from slide.slides import (
     update_slide_routine,
 )
 
+pytestmark = pytest.mark.asyncio
+
+_OK_RESPONSE = {"msg": "Hi!"}
+
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
-    "response, expected_result",
+    "response, expected_slides",
     [
         (
             {
@@ -52,7 +54,7 @@ from slide.slides import (
                 ]
             },
             [
-                SlideDetail(
+                dict(
                     id="test",
                     device_name="some-name",
                     slide_setup="setup",
@@ -72,15 +74,14 @@ from slide.slides import (
     ],
 )
 async def test_get_slides(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     response: dict[str, Any],
-    expected_result: list[SlideDetail],
+    expected_slides: list[dict[str, Any]],
 ):
     """Test get_slides."""
     mock_request.return_value = response
 
-    slide_cloud = SlideCloud(username="user", password="password")
-
     result = await get_slides(slide=slide_cloud)
 
     mock_request.assert_called_once_with(
@@ -88,13 +89,11 @@ async def test_get_slides(
         url_suffix="/slides/overview",
     )
 
-    assert result == expected_result
+    assert result == [SlideDetail(**slide) for slide in expected_slides]
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
-    "slide_id, response, expected_result",
+    "slide_id, response, expected_slide",
     [
         (
             1,
@@ -118,7 +117,7 @@ async def test_get_slides(
                     features={},
                 )
             },
-            SlideDetailSingle(
+            dict(
                 id=1,
                 device_name="test",
                 slide_setup="something",
@@ -140,63 +139,50 @@ async def test_get_slides(
     ],
 )
 async def test_get_slide(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     slide_id: int,
     response: dict[str, Any],
-    expected_result: SlideDetailSingle,
+    expected_slide: dict[str, Any],
 ):
     mock_request.return_value = response
 
-    slide = SlideCloud(username="user", password="password")
-
-    result = await get_slide(slide=slide, slide_id=slide_id)
+    result = await get_slide(slide=slide_cloud, slide_id=slide_id)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.GET,
         url_suffix=f"/slides/{slide_id}",
     )
 
-    assert result == expected_result
+    assert result == SlideDetailSingle(**expected_slide)
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "slide_id, enable",
-    [
-        (1, True),
-        (2, False),
-    ],
-)
-async def test_set_touch_and_go(
-    mock_request: AsyncMock,
-    slide_id: int,
-    enable: bool,
-):
+async def test_set_touch_and_go(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test set_touch_and_go."""
-    mock_request.return_value = {"msg": "Hi!"}
-
-    slide = SlideCloud(username="user", password="password")
-
-    result = await set_touch_and_go(slide=slide, slide_id=slide_id, enable=enable)
+    mock_request.return_value = _OK_RESPONSE
+    arguments = ((1, True), (2, False))
 
-    mock_request.assert_called_once_with(
-        request_type=RequestTypes.PATCH,
-        url_suffix=f"/slide/{slide_id}",
-        data={"touch_go": enable},
-    )
+    for slide_id, enable in arguments:
+        assert await set_touch_and_go(
+            slide=slide_cloud, slide_id=slide_id, enable=enable
+        )
 
-    assert result
+    assert mock_request.call_args_list == [
+        call(
+            request_type=RequestTypes.PATCH,
+            url_suffix=f"/slide/{slide_id}",
+            data={"touch_go": enable},
+        )
+        for slide_id, enable in arguments
+    ]
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
-    "slide, slide_id, response, expected_result",
+    "slide_fixture, expected_suffix, response, expected_result",
     [
         (
-            SlideCloud(username="user", password="password"),
-            1,
+            "slide_cloud",
+            "/slide/1/info",
             {
                 "data": dict(
                     board_rev=1,
@@ -219,8 +205,8 @@ async def test_set_touch_and_go(
             ),
         ),
         (
-            SlideLocal(device_code="asdf", base_url="http://localhost"),
-            1,
+            "slide_local",
+            "/rpc/Slide.GetInfo",
             dict(
                 board_rev=1,
                 calib_time=2,
@@ -243,154 +229,85 @@ async def test_set_touch_and_go(
     ],
 )
 async def test_get_slide_state(
-    mock_request: AsyncMock,
-    slide: SlideCloud | SlideLocal,
-    slide_id: int,
+    mock_request: MagicMock,
+    request: pytest.FixtureRequest,
+    slide_fixture: str,
+    expected_suffix: str,
     response: dict[str, Any],
     expected_result: SlideState | None,
 ):
+    slide = request.getfixturevalue(slide_fixture)
     mock_request.return_value = response
 
-    result = await get_slide_state(slide=slide, slide_id=slide_id)
+    result = await get_slide_state(slide=slide, slide_id=1)
 
-    if isinstance(slide, SlideCloud):
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.GET,
-            url_suffix=f"/slide/{slide_id}/info",
-        )
-    else:
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.GET,
-            url_suffix="/rpc/Slide.GetInfo",
-        )
+    mock_request.assert_called_once_with(
+        request_type=RequestTypes.GET,
+        url_suffix=expected_suffix,
+    )
 
     assert result == expected_result
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
-    "slide, slide_id, position",
+    "slide_fixture, expected_suffix, position",
     [
-        (
-            SlideCloud(username="user", password="password"),
-            1,
-            1.0,
-        ),
-        (
-            SlideLocal(device_code="asdf", base_url="http://localhost"),
-            1,
-            0.0,
-        ),
+        ("slide_cloud", "/slide/1/position", 1.0),
+        ("slide_local", "/rpc/Slide.SetPos", 0.0),
     ],
 )
 async def test_set_slide_position(
-    mock_request: AsyncMock,
-    slide: SlideCloud | SlideLocal,
-    slide_id: int,
+    mock_request: MagicMock,
+    request: pytest.FixtureRequest,
+    slide_fixture: str,
+    expected_suffix: str,
     position: float,
 ):
     """Test set_slide_position."""
-    mock_request.return_value = {"msg": "Hi!"}
-
-    result = await set_slide_position(slide=slide, slide_id=slide_id, position=position)
-
-    if isinstance(slide, SlideCloud):
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.POST,
-            url_suffix=f"/slide/{slide_id}/position",
-            data={"pos": position},
-        )
-    else:
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.POST,
-            url_suffix="/rpc/Slide.SetPos",
-            data={"pos": position},
-        )
-
-    assert result
+    slide = request.getfixturevalue(slide_fixture)
+    mock_request.return_value = _OK_RESPONSE
 
+    result = await set_slide_position(slide=slide, slide_id=1, position=position)
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "slide, slide_id",
-    [
-        (
-            SlideCloud(username="user", password="password"),
-            1,
-        ),
-        (
-            SlideLocal(device_code="asdf", base_url="http://localhost"),
-            1,
-        ),
-    ],
-)
-async def test_calibrate_slide(
-    mock_request: AsyncMock,
-    slide: SlideCloud | SlideLocal,
-    slide_id: int,
-):
-    """Test calibrate_slide."""
-    mock_request.return_value = {"msg": "Hi!"}
-
-    result = await calibrate_slide(slide=slide, slide_id=slide_id)
-
-    if isinstance(slide, SlideCloud):
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.POST,
-            url_suffix=f"/slide/{slide_id}/calibrate",
-        )
-    else:
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.POST,
-            url_suffix="/rpc/Slide.Calibrate",
-        )
+    mock_request.assert_called_once_with(
+        request_type=RequestTypes.POST,
+        url_suffix=expected_suffix,
+        data={"pos": position},
+    )
 
     assert result
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
-    "slide, slide_id",
+    "command, slide_fixture, expected_suffix",
     [
-        (
-            SlideCloud(username="user", password="password"),
-            1,
-        ),
-        (
-            SlideLocal(device_code="asdf", base_url="http://localhost"),
-            1,
-        ),
+        (calibrate_slide, "slide_cloud", "/slide/1/calibrate"),
+        (calibrate_slide, "slide_local", "/rpc/Slide.Calibrate"),
+        (stop_slide, "slide_cloud", "/slide/1/stop"),
+        (stop_slide, "slide_local", "/rpc/Slide.Stop"),
     ],
 )
-async def test_stop_slide(
-    mock_request: AsyncMock,
-    slide: SlideCloud | SlideLocal,
-    slide_id: int,
+async def test_slide_commands(
+    mock_request: MagicMock,
+    request: pytest.FixtureRequest,
+    command: Callable[..., Awaitable[bool]],
+    slide_fixture: str,
+    expected_suffix: str,
 ):
-    """Test stop_slide."""
-    mock_request.return_value = {"msg": "Hi!"}
+    """Test calibrate_slide and stop_slide."""
+    slide = request.getfixturevalue(slide_fixture)
+    mock_request.return_value = _OK_RESPONSE
 
-    result = await stop_slide(slide=slide, slide_id=slide_id)
+    result = await command(slide=slide, slide_id=1)
 
-    if isinstance(slide, SlideCloud):
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.POST,
-            url_suffix=f"/slide/{slide_id}/stop",
-        )
-    else:
-        mock_request.assert_called_once_with(
-            request_type=RequestTypes.POST,
-            url_suffix="/rpc/Slide.Stop",
-        )
+    mock_request.assert_called_once_with(
+        request_type=RequestTypes.POST,
+        url_suffix=expected_suffix,
+    )
 
     assert result
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "slide_id, response, expected_result",
     [
@@ -435,16 +352,15 @@ async def test_stop_slide(
     ],
 )
 async def test_get_slide_routines(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     slide_id: int,
     response: dict[str, Any],
     expected_result: list[Routine] | None,
 ):
     mock_request.return_value = response
 
-    slide = SlideCloud(username="user", password="password")
-
-    result = await get_slide_routines(slide=slide, slide_id=slide_id)
+    result = await get_slide_routines(slide=slide_cloud, slide_id=slide_id)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.GET,
@@ -454,112 +370,54 @@ async def test_get_slide_routines(
     assert result == expected_result
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "slide_id, routine_id",
-    [
-        (
-            1,
-            "2",
-        ),
-        (
-            1,
-            "2",
-        ),
-    ],
-)
-async def test_delete_slide_routines(
-    mock_request: AsyncMock,
-    slide_id: int,
-    routine_id: str,
-):
+async def test_delete_slide_routines(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test delete_slide_routines."""
-    slide = SlideCloud(username="user", password="password")
-
-    await delete_slide_routines(
-        slide=slide, slide_id=slide_id, routine_ids=[routine_id]
-    )
+    await delete_slide_routines(slide=slide_cloud, slide_id=1, routine_ids=["2"])
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.DELETE,
-        url_suffix=f"/slide/{slide_id}/routines",
-        data=[{"id": routine_id}],
+        url_suffix="/slide/1/routines",
+        data=[{"id": "2"}],
     )
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "slide_id",
-    [
-        1,
-    ],
-)
-async def test_update_slide_routine(
-    mock_request: AsyncMock,
-    slide_id: int,
-):
+async def test_update_slide_routine(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test update_slide_routine."""
-    slide = SlideCloud(username="user", password="password")
-    await update_slide_routine(slide=slide, slide_id=slide_id, routines=[])
+    await update_slide_routine(slide=slide_cloud, slide_id=1, routines=[])
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.PUT,
-        url_suffix=f"/slide/{slide_id}/routines",
+        url_suffix="/slide/1/routines",
         data=[],
     )
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "slide_id",
-    [1],
-)
-async def test_create_slide_routine(
-    mock_request: AsyncMock,
-    slide_id: int,
-):
+async def test_create_slide_routine(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test create_slide_routine."""
-    slide = SlideCloud(username="user", password="password")
-
-    await create_slide_routine(slide=slide, slide_id=slide_id, routines=[])
+    await create_slide_routine(slide=slide_cloud, slide_id=1, routines=[])
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.POST,
-        url_suffix=f"/slide/{slide_id}/routines",
+        url_suffix="/slide/1/routines",
         data=[],
     )
 
 
-@pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "ssid, password",
-    [
-        (
-            "some-network",
-            "fake-pass",
-        ),
-        (
-            "another-network",
-            "another-password",
-        ),
-    ],
-)
-async def test_configure_slide_wifi(
-    mock_request: AsyncMock,
-    ssid: str,
-    password: str,
-):
+async def test_configure_slide_wifi(mock_request: MagicMock, slide_local: SlideLocal):
     """Test configure_slide_wifi."""
-    slide = SlideLocal(device_code="device_code", base_url="http://localhost")
+    arguments = (
+        ("some-network", "fake-pass"),
+        ("another-network", "another-password"),
+    )
 
-    await configure_slide_wifi(slide=slide, ssid=ssid, password=password)
+    for ssid, password in arguments:
+        await configure_slide_wifi(slide=slide_local, ssid=ssid, password=password)
 
-    mock_request.assert_called_once_with(
-        request_type=RequestTypes.POST,
-        url_suffix="/rpc/Slide.Config.WiFi",
-        data={"ssid": ssid, "pass": password},
-    )
+    assert mock_request.call_args_list == [
+        call(
+            request_type=RequestTypes.POST,
+            url_suffix="/rpc/Slide.Config.WiFi",
+            data={"ssid": ssid, "pass": password},
+        )
+        for ssid, password in arguments
+    ]
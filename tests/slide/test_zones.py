@@ -1,7 +1,7 @@
 """Test the zones module in the slide package."""
 from datetime import datetime
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, call
 
 import pytest
 from slide.base_models import (
@@ -24,44 +24,41 @@ from slide.zones import (
     update_zone,
 )
 
+_OK_RESPONSE = {"msg": "Hi!"}
+
 
 @pytest.mark.parametrize(
-    "zone, expected_created_at, expected_updated_at",
+    "created_at, updated_at, expected_created_at, expected_updated_at",
     [
         (
-            Zone(
-                id="1",
-                name="Zone 1",
-                household_id=1,
-                created_at="2022-01-01T00:00:00.000Z",
-                updated_at="2022-01-02T00:00:00.000Z",
-            ),
+            "2022-01-01T00:00:00.000Z",
+            "2022-01-02T00:00:00.000Z",
             datetime(2022, 1, 1, 0, 0, 0),
             datetime(2022, 1, 2, 0, 0, 0),
         ),
-        (
-            Zone(
-                id="1",
-                name="Zone 2",
-                household_id=2,
-                created_at=None,
-                updated_at=None,
-            ),
-            None,
-            None,
-        ),
+        (None, None, None, None),
     ],
 )
 def test_created_at_datetime(
-    zone: Zone, expected_created_at: datetime, expected_updated_at: datetime
+    created_at: str | None,
+    updated_at: str | None,
+    expected_created_at: datetime | None,
+    expected_updated_at: datetime | None,
 ):
     """Test the created_at_datetime and updated_at_datetime properties."""
+    zone = Zone(
+        id="1",
+        name="Zone 1",
+        household_id=1,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
     assert zone.created_at_datetime == expected_created_at
     assert zone.updated_at_datetime == expected_updated_at
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "response, expected_result",
     [
@@ -104,16 +101,15 @@ def test_created_at_datetime(
     ],
 )
 async def test_get_zones(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     response: dict[str, Any],
     expected_result: list[Zone],
 ):
     """Test get_zones."""
     mock_request.return_value = response
 
-    slide = SlideCloud(username="user", password="password")
-
-    result = await get_zones(slide=slide)
+    result = await get_zones(slide=slide_cloud)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.GET,
@@ -124,32 +120,25 @@ async def test_get_zones(
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "zone_name",
-    [
-        "test",
-        "test-2",
-    ],
-)
-async def test_create_zone(
-    mock_request: AsyncMock,
-    zone_name: str,
-):
+async def test_create_zone(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test create_zone."""
-    mock_request.return_value = {"msg": "Hi!"}
-
-    slide = SlideCloud(username="user", password="password")
+    mock_request.return_value = _OK_RESPONSE
+    zone_names = ("test", "test-2")
 
-    await create_zone(slide=slide, zone_name=zone_name)
+    for zone_name in zone_names:
+        await create_zone(slide=slide_cloud, zone_name=zone_name)
 
-    mock_request.assert_called_once_with(
-        request_type=RequestTypes.POST, url_suffix="/zones", data={"name": zone_name}
-    )
+    assert mock_request.call_args_list == [
+        call(
+            request_type=RequestTypes.POST,
+            url_suffix="/zones",
+            data={"name": zone_name},
+        )
+        for zone_name in zone_names
+    ]
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "slide_id, zone_id",
     [
@@ -164,16 +153,15 @@ async def test_create_zone(
     ],
 )
 async def test_move_slide_to_zone(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     slide_id: int,
     zone_id: int,
 ):
     """Test move_slide_to_zone."""
-    mock_request.return_value = {"msg": "Hi!"}
+    mock_request.return_value = _OK_RESPONSE
 
-    slide = SlideCloud(username="user", password="password")
-
-    await move_slide_to_zone(slide=slide, slide_id=slide_id, zone_id=zone_id)
+    await move_slide_to_zone(slide=slide_cloud, slide_id=slide_id, zone_id=zone_id)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.PATCH,
@@ -182,64 +170,43 @@ async def test_move_slide_to_zone(
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "zone_id, zone_name",
-    [
-        (
-            1,
-            "test",
-        ),
-        (
-            2,
-            "test-2",
-        ),
-    ],
-)
-async def test_update_zone(
-    mock_request: AsyncMock,
-    zone_id: int,
-    zone_name: str,
-):
+async def test_update_zone(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test update_zone."""
-    mock_request.return_value = {"msg": "Hi!"}
+    mock_request.return_value = _OK_RESPONSE
+    arguments = ((1, "test"), (2, "test-2"))
 
-    slide = SlideCloud(username="user", password="password")
+    for zone_id, zone_name in arguments:
+        await update_zone(slide=slide_cloud, zone_id=zone_id, zone_name=zone_name)
 
-    await update_zone(slide=slide, zone_id=zone_id, zone_name=zone_name)
-
-    mock_request.assert_called_once_with(
-        request_type=RequestTypes.PUT,
-        url_suffix=f"/zones/{zone_id}",
-        data={"name": zone_name},
-    )
+    assert mock_request.call_args_list == [
+        call(
+            request_type=RequestTypes.PUT,
+            url_suffix=f"/zones/{zone_id}",
+            data={"name": zone_name},
+        )
+        for zone_id, zone_name in arguments
+    ]
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "zone_id",
-    [1, 2],
-)
-async def test_remove_zone(
-    mock_request: AsyncMock,
-    zone_id: int,
-):
-    """Test update_zone."""
-    mock_request.return_value = {"msg": "Hi!"}
+async def test_remove_zone(mock_request: MagicMock, slide_cloud: SlideCloud):
+    """Test remove_zone."""
+    mock_request.return_value = _OK_RESPONSE
+    zone_ids = (1, 2)
 
-    slide = SlideCloud(username="user", password="password")
+    for zone_id in zone_ids:
+        await remove_zone(slide=slide_cloud, zone_id=zone_id)
 
-    await remove_zone(slide=slide, zone_id=zone_id)
-
-    mock_request.assert_called_once_with(
-        request_type=RequestTypes.DELETE,
-        url_suffix=f"/zones/{zone_id}",
-    )
+    assert mock_request.call_args_list == [
+        call(
+            request_type=RequestTypes.DELETE,
+            url_suffix=f"/zones/{zone_id}",
+        )
+        for zone_id in zone_ids
+    ]
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "zone_id, response, expected_result",
     [
@@ -285,7 +252,8 @@ async def test_remove_zone(
     ],
 )
 async def test_get_zone_routines(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     zone_id: int,
     response: dict[str, Any],
     expected_result: list[Zone],
@@ -293,9 +261,7 @@ async def test_get_zone_routines(
     """Test get_zone_routines."""
     mock_request.return_value = response
 
-    slide = SlideCloud(username="user", password="password")
-
-    result = await get_zone_routines(slide=slide, zone_id=zone_id)
+    result = await get_zone_routines(slide=slide_cloud, zone_id=zone_id)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.GET,
@@ -306,21 +272,19 @@ async def test_get_zone_routines(
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "zone_id",
     [1, 2],
 )
 async def test_create_zone_routine(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     zone_id: int,
 ):
     """Test create_zone_routine."""
-    mock_request.return_value = {"msg": "Hi!"}
+    mock_request.return_value = _OK_RESPONSE
 
-    slide = SlideCloud(username="user", password="password")
-
-    await create_zone_routine(slide=slide, zone_id=zone_id, routines=[])
+    await create_zone_routine(slide=slide_cloud, zone_id=zone_id, routines=[])
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.POST,
@@ -330,7 +294,6 @@ async def test_create_zone_routine(
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "zone_id, response, expected_result",
     [
@@ -371,7 +334,8 @@ async def test_create_zone_routine(
     ],
 )
 async def test_get_zone_slides(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     zone_id: int,
     response: dict[str, Any],
     expected_result: list[Zone],
@@ -379,9 +343,7 @@ async def test_get_zone_slides(
     """Test get_zone_slides."""
     mock_request.return_value = response
 
-    slide = SlideCloud(username="user", password="password")
-
-    result = await get_zone_slides(slide=slide, zone_id=zone_id)
+    result = await get_zone_slides(slide=slide_cloud, zone_id=zone_id)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.GET,
@@ -392,55 +354,38 @@ async def test_get_zone_slides(
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
-@pytest.mark.parametrize(
-    "zone_id, position",
-    [
-        (
-            1,
-            0.5,
-        ),
-        (
-            2,
-            1,
-        ),
-    ],
-)
-async def test_set_zone_position(
-    mock_request: AsyncMock,
-    zone_id: int,
-    position: float,
-):
+async def test_set_zone_position(mock_request: MagicMock, slide_cloud: SlideCloud):
     """Test set_zone_position."""
-    mock_request.return_value = {"msg": "Hi!"}
+    mock_request.return_value = _OK_RESPONSE
+    arguments = ((1, 0.5), (2, 1))
 
-    slide = SlideCloud(username="user", password="password")
+    for zone_id, position in arguments:
+        await set_zone_position(slide=slide_cloud, zone_id=zone_id, position=position)
 
-    await set_zone_position(slide=slide, zone_id=zone_id, position=position)
-
-    mock_request.assert_called_once_with(
-        request_type=RequestTypes.POST,
-        url_suffix=f"/zones/{zone_id}/position",
-        data={"pos": position},
-    )
+    assert mock_request.call_args_list == [
+        call(
+            request_type=RequestTypes.POST,
+            url_suffix=f"/zones/{zone_id}/position",
+            data={"pos": position},
+        )
+        for zone_id, position in arguments
+    ]
 
 
 @pytest.mark.asyncio
-@patch("slide.base_models.Slide.request", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "zone_id",
     [1, 2],
 )
 async def test_calibrate_zone(
-    mock_request: AsyncMock,
+    mock_request: MagicMock,
+    slide_cloud: SlideCloud,
     zone_id: int,
 ):
     """Test calibrate_zone."""
-    mock_request.return_value = {"msg": "Hi!"}
-
-    slide = SlideCloud(username="user", password="password")
+    mock_request.return_value = _OK_RESPONSE
 
-    await calibrate_zone(slide=slide, zone_id=zone_id)
+    await calibrate_zone(slide=slide_cloud, zone_id=zone_id)
 
     mock_request.assert_called_once_with(
         request_type=RequestTypes.POST,